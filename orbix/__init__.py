@@ -6,13 +6,17 @@ from .exceptions import (
     UserNotFoundError,
 )
 from .models import (
+    BadgePage,
     FavouriteGame,
+    FavouriteGamePage,
     Game,
     LimitedItem,
+    LimitedItemPage,
     UserAvatar,
     UserBadge,
     UserPresence,
     UserProfile,
+    UserProfileBatch,
     WearingItem,
 )
 
@@ -20,9 +24,12 @@ __version__ = "1.0.0"
 __author__ = "Bram"
 
 __all__ = [
+    "BadgePage",
     "FavouriteGame",
+    "FavouriteGamePage",
     "Game",
     "LimitedItem",
+    "LimitedItemPage",
     "NetworkError",
     "OrbixClient",
     "RateLimitError",
@@ -32,5 +39,6 @@ __all__ = [
     "UserNotFoundError",
     "UserPresence",
     "UserProfile",
+    "UserProfileBatch",
     "WearingItem",
 ]
@@ -1,45 +1,252 @@
 from __future__ import annotations
 
 import logging
-from asyncio import gather
+from array import array
+from asyncio import (
+    Semaphore,
+    TaskGroup,
+    as_completed,
+    gather,
+)
 from dataclasses import replace
-from datetime import datetime
-from typing import Any, Self, cast
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Self
+
+import orjson
 
 from .core import (
     HTTPClient,
-    rate_limit,
+    parse_iso,
     retry_on_failure,
 )
-from .exceptions import UserNotFoundError
+from .exceptions import (
+    RateLimitError,
+    RobloxAPIError,
+    UserNotFoundError,
+)
 from .models import (
+    BadgePage,
     FavouriteGame,
+    FavouriteGamePage,
     Game,
     LimitedItem,
+    LimitedItemPage,
     UserAvatar,
     UserBadge,
     UserPresence,
     UserProfile,
+    UserProfileBatch,
     WearingItem,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import (
+        AsyncIterator,
+        Awaitable,
+    )
+
 log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _sid(n: int) -> str:
+    return str(n)
+
+
+def _snap_limit(limit: int) -> int:
+    if limit <= 17:
+        return 10
+    if limit <= 37:
+        return 25
+    if limit <= 75:
+        return 50
+    return 100
+
+
+async def _count_safe(coro: Awaitable[int]) -> int:
+    try:
+        return await coro
+    except Exception as e:
+        log.warning("couldn't grab a count: %s", e)
+        return 0
+
+
+def _parse_user_profile(
+    data: dict[str, Any],
+    follower_count: int = 0,
+    following_count: int = 0,
+    friend_count: int = 0,
+) -> UserProfile:
+    return UserProfile(
+        id=data["id"],
+        username=data["name"],
+        display_name=data["displayName"],
+        description=data.get(
+            "description", ""
+        ),
+        created_raw=data.get("created"),
+        follower_count=follower_count,
+        following_count=following_count,
+        friend_count=friend_count,
+        is_verified=data.get(
+            "hasVerifiedBadge", False
+        ),
+    )
+
+
+def _parse_user_profile_simple(
+    data: dict[str, Any],
+) -> UserProfile:
+    return UserProfile(
+        id=data["id"],
+        username=data["name"],
+        display_name=data["displayName"],
+        description="",
+        created_raw=None,
+        follower_count=0,
+        following_count=0,
+        friend_count=0,
+        is_verified=data.get(
+            "hasVerifiedBadge", False
+        ),
+    )
+
+
+def _parse_user_badge(
+    data: dict[str, Any],
+) -> UserBadge:
+    get = data.get
+    statistics = get("statistics", {})
+
+    return UserBadge(
+        id=data["id"],
+        name=data["name"],
+        description=get("description", ""),
+        enabled=get("enabled", True),
+        icon_image_id=get("iconImageId", 0),
+        created=parse_iso(
+            get("created")
+        ),
+        awarded_count=statistics.get(
+            "awardedCount", 0
+        ),
+        win_rate_percentage=statistics.get(
+            "winRatePercentage", 0.0
+        ),
+    )
+
+
+def _parse_user_presence(
+    data: dict[str, Any],
+) -> UserPresence:
+    get = data.get
+
+    return UserPresence(
+        user_id=data["userId"],
+        presence_type=get(
+            "userPresenceType", 0
+        ),
+        last_location=get("lastLocation", ""),
+        place_id=get("placeId"),
+        root_place_id=get("rootPlaceId"),
+        game_id=get("gameId"),
+        universe_id=get("universeId"),
+    )
+
+
+def _parse_game_basic(
+    data: dict[str, Any],
+) -> Game:
+    get = data.get
+    creator = get("creator", {})
+
+    return Game(
+        id=get("id", 0),
+        root_place_id=get("rootPlaceId", 0),
+        name=get("name", ""),
+        description=get("description", ""),
+        creator_id=creator.get("id", 0),
+        creator_name=creator.get("name", ""),
+        creator_type=creator.get(
+            "type", "User"
+        ),
+        playing=get("playing", 0),
+        visits=get("visits", 0),
+        max_players=get("maxPlayers", 0),
+        created=parse_iso(
+            get("created")
+        ),
+        genre=get("genre", ""),
+    )
+
+
+def _parse_game_detailed(
+    data: dict[str, Any],
+) -> Game:
+    get = data.get
+    creator = get("creator", {})
+
+    return Game(
+        id=data["id"],
+        root_place_id=data["rootPlaceId"],
+        name=data["name"],
+        description=get("description", ""),
+        creator_id=creator.get("id", 0),
+        creator_name=creator.get("name", ""),
+        creator_type=creator.get(
+            "type", "User"
+        ),
+        playing=get("playing", 0),
+        visits=get("visits", 0),
+        max_players=get("maxPlayers", 0),
+        created=parse_iso(
+            get("created")
+        ),
+        genre=get("genre", ""),
+    )
+
+
+def _parse_limited_item(
+    data: dict[str, Any],
+) -> LimitedItem:
+    get = data.get
+
+    return LimitedItem(
+        user_asset_id=get("userAssetId", 0),
+        serial_number=get("serialNumber", 0),
+        asset_id=get("assetId", 0),
+        name=get("name", ""),
+        recent_average_price=get(
+            "recentAveragePrice", 0
+        ),
+        original_price=get("originalPrice", 0),
+        asset_stock=get("assetStock", 0),
+        is_on_hold=get("isOnHold", False),
+    )
+
+
 class OrbixClient:
     def __init__(
         self,
         timeout: int = 30,
         cache_ttl: int = 300,
+        cache_size: int = 10_000,
+        shared_session: bool = False,
     ) -> None:
         self._http = HTTPClient(
             timeout=timeout,
             cache_ttl=cache_ttl,
+            cache_size=cache_size,
+            shared=shared_session,
         )
 
     async def close(self) -> None:
         await self._http.close()
 
+    @classmethod
+    async def close_shared(cls) -> None:
+        await HTTPClient.close_shared()
+
     async def __aenter__(self) -> Self:
         return self
 
@@ -54,120 +261,177 @@ class OrbixClient:
     async def warm_cache(
         self,
         user_ids: list[int],
+        concurrency: int = 8,
     ) -> None:
+        if concurrency < 1:
+            raise ValueError(
+                "concurrency must be at least 1"
+            )
+
         if not user_ids:
             return
 
-        chunk_size = 50
-        tasks = [
-            self.get_users_batch(
-                user_ids[i : i + chunk_size]
-            )
+        chunk_size = 100
+        semaphore = Semaphore(concurrency)
+
+        async def prefetch(
+            chunk: list[int],
+        ) -> None:
+            async with semaphore:
+                try:
+                    await self.get_users_batch_with_counts(
+                        chunk
+                    )
+                except Exception as e:
+                    log.warning(
+                        "couldn't warm cache for %d users: %s",
+                        len(chunk),
+                        e,
+                    )
+
+        async with TaskGroup() as tg:
             for i in range(
                 0, len(user_ids), chunk_size
-            )
-        ]
-
-        await gather(
-            *tasks, return_exceptions=True
-        )
+            ):
+                tg.create_task(
+                    prefetch(
+                        user_ids[i : i + chunk_size]
+                    )
+                )
 
-    @rate_limit(calls_per_minute=120)
     @retry_on_failure(max_retries=3)
     async def get_user(
         self,
         user_id: int,
+        include_counts: bool = True,
     ) -> UserProfile:
         response = await self._http.get(
             "users", f"/v1/users/{user_id}"
         )
-
-        profile = self._parse_user_profile(
-            response
+        if not include_counts:
+            return _parse_user_profile(response)
+
+        (
+            follower_count,
+            following_count,
+            friend_count,
+        ) = await self._fetch_counts(user_id)
+
+        return _parse_user_profile(
+            response,
+            follower_count=follower_count,
+            following_count=following_count,
+            friend_count=friend_count,
         )
 
-        try:
-            results = await gather(
-                self.get_user_follower_count(
-                    user_id
-                ),
-                self.get_user_following_count(
-                    user_id
-                ),
-                self.get_user_friend_count(
-                    user_id
-                ),
-                return_exceptions=True,
+    @retry_on_failure(max_retries=3)
+    async def get_users_batch(
+        self,
+        user_ids: list[int],
+    ) -> list[UserProfile]:
+        if len(user_ids) > 100:
+            raise ValueError(
+                "batch limited to 100 users"
             )
 
-            counts = [
-                cast("int", r)
-                if not isinstance(r, Exception)
-                else 0
-                for r in results
-            ]
+        if not user_ids:
+            return []
 
-            profile = replace(
-                profile,
-                follower_count=counts[0],
-                following_count=counts[1],
-                friend_count=counts[2],
-            )
-        except Exception:
-            log.exception(
-                "couldn't grab follower counts for user %d",
-                user_id,
+        response = await self._fetch_users_batch(
+            user_ids
+        )
+
+        make_profile = UserProfile
+        profiles: list[UserProfile] = []
+        append = profiles.append
+        for ud in response.get("data") or ():
+            get = ud.get
+            name = ud["name"]
+            append(
+                make_profile(
+                    ud["id"],
+                    name,
+                    get("displayName", name),
+                    get("description", ""),
+                    get("created"),
+                    0,
+                    0,
+                    0,
+                    get("hasVerifiedBadge", False),
+                )
             )
 
-        return profile
+        return profiles
 
-    @rate_limit(calls_per_minute=120)
     @retry_on_failure(max_retries=3)
-    async def get_users_batch(
+    async def get_users_batch_columnar(
         self,
         user_ids: list[int],
-    ) -> list[UserProfile]:
+    ) -> UserProfileBatch:
         if len(user_ids) > 100:
             raise ValueError(
                 "batch limited to 100 users"
             )
 
-        if not user_ids:
-            return []
+        rows: list[dict[str, Any]] = []
+        if user_ids:
+            response = await self._fetch_users_batch(
+                user_ids
+            )
+            rows = response.get("data") or rows
+
+        return UserProfileBatch(
+            ids=array("q", [ud["id"] for ud in rows]),
+            usernames=[ud["name"] for ud in rows],
+            display_names=[
+                ud.get("displayName", ud["name"])
+                for ud in rows
+            ],
+            descriptions=[
+                ud.get("description", "")
+                for ud in rows
+            ],
+            created_raws=[
+                ud.get("created") for ud in rows
+            ],
+            verified=[
+                ud.get("hasVerifiedBadge", False)
+                for ud in rows
+            ],
+        )
 
-        response = await self._http.post(
-            "users",
-            "/v1/users",
-            data={
-                "userIds": user_ids,
-                "excludeBannedUsers": True,
-            },
+    async def get_users_batch_with_counts(
+        self,
+        user_ids: list[int],
+        include_counts: bool = False,
+    ) -> list[UserProfile]:
+        profiles = await self.get_users_batch(
+            user_ids
+        )
+        if not include_counts:
+            return profiles
+
+        counts = await gather(
+            *(
+                self._fetch_counts(profile.id)
+                for profile in profiles
+            )
         )
 
         return [
-            self._parse_user_profile(ud)
-            if "created" in ud
-            else UserProfile(
-                id=ud["id"],
-                username=ud["name"],
-                display_name=ud.get(
-                    "displayName", ud["name"]
-                ),
-                description=ud.get(
-                    "description", ""
-                ),
-                created_date=None,
-                follower_count=0,
-                following_count=0,
-                friend_count=0,
-                is_verified=ud.get(
-                    "hasVerifiedBadge", False
-                ),
+            replace(
+                profile,
+                follower_count=follower_count,
+                following_count=following_count,
+                friend_count=friend_count,
             )
-            for ud in response.get("data", [])
+            for profile, (
+                follower_count,
+                following_count,
+                friend_count,
+            ) in zip(profiles, counts, strict=True)
         ]
 
-    @rate_limit(calls_per_minute=120)
     @retry_on_failure(max_retries=3)
     async def get_user_by_username(
         self,
@@ -188,7 +452,6 @@ class OrbixClient:
 
         return await self.get_user(data[0]["id"])
 
-    @rate_limit(calls_per_minute=180)
     @retry_on_failure(max_retries=3)
     async def get_user_avatar(
         self,
@@ -197,59 +460,160 @@ class OrbixClient:
         bust_size: str = "48x48",
         full_body_size: str = "150x150",
     ) -> UserAvatar:
-        results = await gather(
-            self._http.get(
+        try:
+            response = await self._http.post(
                 "thumbnails",
+                "/v1/batch",
+                data=[
+                    {
+                        "requestId": "headshot",
+                        "type": "AvatarHeadShot",
+                        "targetId": user_id,
+                        "size": headshot_size,
+                        "format": "Png",
+                    },
+                    {
+                        "requestId": "bust",
+                        "type": "AvatarBust",
+                        "targetId": user_id,
+                        "size": bust_size,
+                        "format": "Png",
+                    },
+                    {
+                        "requestId": "full_body",
+                        "type": "Avatar",
+                        "targetId": user_id,
+                        "size": full_body_size,
+                        "format": "Png",
+                    },
+                ],
+                cache_key=(
+                    user_id,
+                    headshot_size,
+                    bust_size,
+                    full_body_size,
+                ),
+            )
+        except RateLimitError:
+            raise
+        except RobloxAPIError as e:
+            log.warning(
+                "thumbnail batch failed for user %d, fetching separately: %s",
+                user_id,
+                e,
+            )
+            return await self._get_user_avatar_separately(
+                user_id,
+                headshot_size,
+                bust_size,
+                full_body_size,
+            )
+
+        urls = {
+            entry.get("requestId"): entry.get(
+                "imageUrl"
+            )
+            or ""
+            for entry in response.get("data") or ()
+        }
+
+        return UserAvatar(
+            user_id=user_id,
+            headshot_url=urls.get("headshot", ""),
+            bust_url=urls.get("bust", ""),
+            full_body_url=urls.get("full_body", ""),
+        )
+
+    @retry_on_failure(max_retries=3)
+    async def get_users_avatars_batch(
+        self,
+        user_ids: list[int],
+        headshot_size: str = "48x48",
+        bust_size: str = "48x48",
+        full_body_size: str = "150x150",
+    ) -> dict[int, UserAvatar]:
+        if not user_ids:
+            return {}
+
+        if len(user_ids) > 100:
+            raise ValueError(
+                "100 user IDs allowed per request"
+            )
+
+        joined_ids = ",".join(map(_sid, user_ids))
+        (
+            headshot_urls,
+            bust_urls,
+            full_body_urls,
+        ) = await gather(
+            self._fetch_thumbnails(
+                "headshot",
                 "/v1/users/avatar-headshot",
-                params={
-                    "userIds": str(user_id),
-                    "size": headshot_size,
-                    "format": "Png",
-                },
+                joined_ids,
+                len(user_ids),
+                headshot_size,
             ),
-            self._http.get(
-                "thumbnails",
+            self._fetch_thumbnails(
+                "bust",
                 "/v1/users/avatar-bust",
-                params={
-                    "userIds": str(user_id),
-                    "size": bust_size,
-                    "format": "Png",
-                },
+                joined_ids,
+                len(user_ids),
+                bust_size,
             ),
-            self._http.get(
-                "thumbnails",
+            self._fetch_thumbnails(
+                "full_body",
                 "/v1/users/avatar",
-                params={
-                    "userIds": str(user_id),
-                    "size": full_body_size,
-                    "format": "Png",
-                },
+                joined_ids,
+                len(user_ids),
+                full_body_size,
             ),
-            return_exceptions=True,
         )
 
-        urls = [
-            self._extract_thumbnail_url(
-                cast(
-                    "dict[str, Any]",
-                    r
-                    if not isinstance(
-                        r, Exception
-                    )
-                    else {},
-                )
+        return {
+            user_id: UserAvatar(
+                user_id=user_id,
+                headshot_url=headshot_urls.get(
+                    user_id, ""
+                ),
+                bust_url=bust_urls.get(user_id, ""),
+                full_body_url=full_body_urls.get(
+                    user_id, ""
+                ),
             )
-            for r in results
-        ]
+            for user_id in user_ids
+        }
 
-        return UserAvatar(
-            user_id=user_id,
-            headshot_url=urls[0],
-            bust_url=urls[1],
-            full_body_url=urls[2],
-        )
+    async def get_user_avatar_stream(
+        self,
+        user_id: int,
+        headshot_size: str = "48x48",
+        bust_size: str = "48x48",
+        full_body_size: str = "150x150",
+    ) -> AsyncIterator[tuple[str, str]]:
+        for thumbnail in as_completed(
+            (
+                self._fetch_thumbnail(
+                    "headshot",
+                    "/v1/users/avatar-headshot",
+                    user_id,
+                    headshot_size,
+                ),
+                self._fetch_thumbnail(
+                    "bust",
+                    "/v1/users/avatar-bust",
+                    user_id,
+                    bust_size,
+                ),
+                self._fetch_thumbnail(
+                    "full_body",
+                    "/v1/users/avatar",
+                    user_id,
+                    full_body_size,
+                ),
+            )
+        ):
+            yield await thumbnail
 
-    @rate_limit(calls_per_minute=120)
     @retry_on_failure(max_retries=3)
     async def get_user_followers(
         self,
@@ -266,11 +630,10 @@ class OrbixClient:
         )
 
         return [
-            self._parse_user_profile_simple(d)
-            for d in response.get("data", [])
+            _parse_user_profile_simple(d)
+            for d in response.get("data") or ()
         ]
 
-    @rate_limit(calls_per_minute=120)
     @retry_on_failure(max_retries=3)
     async def get_user_following(
         self,
@@ -287,11 +650,10 @@ class OrbixClient:
         )
 
         return [
-            self._parse_user_profile_simple(d)
-            for d in response.get("data", [])
+            _parse_user_profile_simple(d)
+            for d in response.get("data") or ()
         ]
 
-    @rate_limit(calls_per_minute=120)
     @retry_on_failure(max_retries=3)
     async def get_user_friends(
         self,
@@ -305,11 +667,10 @@ class OrbixClient:
         )
 
         return [
-            self._parse_user_profile_simple(d)
-            for d in response.get("data", [])
+            _parse_user_profile_simple(d)
+            for d in response.get("data") or ()
         ]
 
-    @rate_limit(calls_per_minute=60)
     @retry_on_failure(max_retries=3)
     async def get_user_follower_count(
         self,
@@ -321,7 +682,6 @@ class OrbixClient:
         )
         return response.get("count", 0)
 
-    @rate_limit(calls_per_minute=60)
     @retry_on_failure(max_retries=3)
     async def get_user_following_count(
         self,
@@ -333,7 +693,6 @@ class OrbixClient:
         )
         return response.get("count", 0)
 
-    @rate_limit(calls_per_minute=60)
     @retry_on_failure(max_retries=3)
     async def get_user_friend_count(
         self,
@@ -345,7 +704,6 @@ class OrbixClient:
         )
         return response.get("count", 0)
 
-    @rate_limit(calls_per_minute=120)
     @retry_on_failure(max_retries=3)
     async def get_user_badges(
         self,
@@ -353,13 +711,8 @@ class OrbixClient:
         limit: int = 10,
         sort_order: str = "Asc",
         cursor: str | None = None,
-    ) -> dict[str, Any]:
-        allowed_limits = [10, 25, 50, 100]
-        if limit not in allowed_limits:
-            limit = min(
-                allowed_limits,
-                key=lambda x: abs(x - limit),
-            )
+    ) -> BadgePage:
+        limit = _snap_limit(limit)
 
         params = {
             "limit": limit,
@@ -375,16 +728,12 @@ class OrbixClient:
             params=params,
         )
 
-        badges = []
-        for badge_data in response.get(
-            "data", []
-        ):
+        parse = _parse_user_badge
+        badges: list[UserBadge] = []
+        append = badges.append
+        for badge_data in response.get("data") or ():
             try:
-                badges.append(
-                    self._parse_user_badge(
-                        badge_data
-                    )
-                )
+                append(parse(badge_data))
             except Exception:
                 log.exception(
                     "badge data looks wonky: %s",
@@ -392,17 +741,16 @@ class OrbixClient:
                 )
                 continue
 
-        return {
-            "badges": badges,
-            "previous_cursor": response.get(
+        return BadgePage(
+            badges=badges,
+            previous_cursor=response.get(
                 "previousPageCursor"
             ),
-            "next_cursor": response.get(
+            next_cursor=response.get(
                 "nextPageCursor"
             ),
-        }
+        )
 
-    @rate_limit(calls_per_minute=120)
     @retry_on_failure(max_retries=3)
     async def get_user_presence(
         self,
@@ -422,16 +770,12 @@ class OrbixClient:
             data={"userIds": user_ids},
         )
 
-        presences = []
-        for presence_data in response.get(
-            "userPresences", []
-        ):
+        parse = _parse_user_presence
+        presences: list[UserPresence] = []
+        append = presences.append
+        for presence_data in response.get("userPresences") or ():
             try:
-                presences.append(
-                    self._parse_user_presence(
-                        presence_data
-                    )
-                )
+                append(parse(presence_data))
             except Exception:
                 log.exception(
                     "presence data is messed up: %s",
@@ -441,7 +785,6 @@ class OrbixClient:
 
         return presences
 
-    @rate_limit(calls_per_minute=120)
     @retry_on_failure(max_retries=3)
     async def get_user_presence_single(
         self,
@@ -452,14 +795,13 @@ class OrbixClient:
         )
         return presences[0] if presences else None
 
-    @rate_limit(calls_per_minute=120)
     @retry_on_failure(max_retries=3)
     async def get_user_favourite_games(
         self,
         user_id: int,
         limit: int = 10,
         cursor: str | None = None,
-    ) -> dict[str, Any]:
+    ) -> FavouriteGamePage:
         params = {
             "limit": min(limit, 50),
             "sortOrder": "Desc",
@@ -475,16 +817,16 @@ class OrbixClient:
                 params=params,
             )
 
-            favourite_games = []
-            for game_data in response.get(
-                "data", []
-            ):
+            parse = _parse_game_basic
+            make_favourite = FavouriteGame
+            favourite_games: list[FavouriteGame] = []
+            append = favourite_games.append
+            for game_data in response.get("data") or ():
                 try:
-                    game = self._parse_game_basic(
-                        game_data
-                    )
-                    favourite_games.append(
-                        FavouriteGame(game=game)
+                    append(
+                        make_favourite(
+                            game=parse(game_data)
+                        )
                     )
                 except Exception:
                     log.exception(
@@ -493,28 +835,27 @@ class OrbixClient:
                     )
                     continue
 
-            return {
-                "favourite_games": favourite_games,
-                "previous_cursor": response.get(
+            return FavouriteGamePage(
+                favourite_games=favourite_games,
+                previous_cursor=response.get(
                     "previousPageCursor"
                 ),
-                "next_cursor": response.get(
+                next_cursor=response.get(
                     "nextPageCursor"
                 ),
-            }
+            )
         except Exception as e:
             log.warning(
                 "can't get favourite games for user %d: %s",
                 user_id,
                 e,
             )
-            return {
-                "favourite_games": [],
-                "previous_cursor": None,
-                "next_cursor": None,
-            }
+            return FavouriteGamePage(
+                favourite_games=[],
+                previous_cursor=None,
+                next_cursor=None,
+            )
 
-    @rate_limit(calls_per_minute=120)
     @retry_on_failure(max_retries=3)
     async def get_game_details(
         self,
@@ -530,7 +871,7 @@ class OrbixClient:
 
         params = {
             "universeIds": ",".join(
-                map(str, universe_ids)
+                map(_sid, universe_ids)
             )
         }
 
@@ -540,14 +881,12 @@ class OrbixClient:
             params=params,
         )
 
-        games = []
-        for game_data in response.get("data", []):
+        parse = _parse_game_detailed
+        games: list[Game] = []
+        append = games.append
+        for game_data in response.get("data") or ():
             try:
-                games.append(
-                    self._parse_game_detailed(
-                        game_data
-                    )
-                )
+                append(parse(game_data))
             except Exception:
                 log.exception(
                     "game data is messed up: %s",
@@ -557,7 +896,6 @@ class OrbixClient:
 
         return games
 
-    @rate_limit(calls_per_minute=120)
     @retry_on_failure(max_retries=3)
     async def get_game_details_single(
         self,
@@ -568,7 +906,6 @@ class OrbixClient:
         )
         return games[0] if games else None
 
-    @rate_limit(calls_per_minute=120)
     @retry_on_failure(max_retries=3)
     async def get_user_currently_wearing(
         self,
@@ -580,9 +917,7 @@ class OrbixClient:
                 f"/v1/users/{user_id}/currently-wearing",
             )
 
-            asset_ids = response.get(
-                "assetIds", []
-            )
+            asset_ids = response.get("assetIds") or ()
             return [
                 WearingItem(asset_id=asset_id)
                 for asset_id in asset_ids
@@ -595,20 +930,14 @@ class OrbixClient:
             )
             return []
 
-    @rate_limit(calls_per_minute=120)
     @retry_on_failure(max_retries=3)
     async def get_user_limited_items(
         self,
         user_id: int,
         limit: int = 10,
         cursor: str | None = None,
-    ) -> dict[str, Any]:
-        allowed_limits = [10, 25, 50, 100]
-        if limit not in allowed_limits:
-            limit = min(
-                allowed_limits,
-                key=lambda x: abs(x - limit),
-            )
+    ) -> LimitedItemPage:
+        limit = _snap_limit(limit)
 
         params = {
             "assetType": "All",
@@ -626,16 +955,12 @@ class OrbixClient:
                 params=params,
             )
 
-            limited_items = []
-            for item_data in response.get(
-                "data", []
-            ):
+            parse = _parse_limited_item
+            limited_items: list[LimitedItem] = []
+            append = limited_items.append
+            for item_data in response.get("data") or ():
                 try:
-                    limited_items.append(
-                        self._parse_limited_item(
-                            item_data
-                        )
-                    )
+                    append(parse(item_data))
                 except Exception:
                     log.exception(
                         "limited item data is messed up: %s",
@@ -643,224 +968,172 @@ class OrbixClient:
                     )
                     continue
 
-            return {
-                "limited_items": limited_items,
-                "previous_cursor": response.get(
+            return LimitedItemPage(
+                limited_items=limited_items,
+                previous_cursor=response.get(
                     "previousPageCursor"
                 ),
-                "next_cursor": response.get(
+                next_cursor=response.get(
                     "nextPageCursor"
                 ),
-            }
+            )
         except Exception as e:
             log.warning(
                 "can't get collectibles for user %d: %s",
                 user_id,
                 e,
             )
-            return {
-                "limited_items": [],
-                "previous_cursor": None,
-                "next_cursor": None,
-            }
+            return LimitedItemPage(
+                limited_items=[],
+                previous_cursor=None,
+                next_cursor=None,
+            )
 
-    @staticmethod
-    def _parse_user_profile(
-        data: dict[str, Any],
-    ) -> UserProfile:
-        created = data.get("created")
-        created_date = (
-            datetime.fromisoformat(created)
-            if created
-            else None
+    async def _fetch_users_batch(
+        self,
+        user_ids: list[int],
+    ) -> dict[str, Any]:
+        ids = tuple(user_ids)
+        return await self._http.post_raw(
+            "users",
+            "/v1/users",
+            orjson.dumps(
+                {
+                    "userIds": ids,
+                    "excludeBannedUsers": True,
+                }
+            ),
+            cache_key=frozenset(ids),
         )
 
-        return UserProfile(
-            id=data["id"],
-            username=data["name"],
-            display_name=data["displayName"],
-            description=data.get(
-                "description", ""
+    async def _get_user_avatar_separately(
+        self,
+        user_id: int,
+        headshot_size: str,
+        bust_size: str,
+        full_body_size: str,
+    ) -> UserAvatar:
+        (
+            (_, headshot_url),
+            (_, bust_url),
+            (_, full_body_url),
+        ) = await gather(
+            self._fetch_thumbnail(
+                "headshot",
+                "/v1/users/avatar-headshot",
+                user_id,
+                headshot_size,
             ),
-            created_date=created_date,
-            follower_count=0,
-            following_count=0,
-            friend_count=0,
-            is_verified=data.get(
-                "hasVerifiedBadge", False
+            self._fetch_thumbnail(
+                "bust",
+                "/v1/users/avatar-bust",
+                user_id,
+                bust_size,
             ),
-        )
-
-    @staticmethod
-    def _parse_user_profile_simple(
-        data: dict[str, Any],
-    ) -> UserProfile:
-        return UserProfile(
-            id=data["id"],
-            username=data["name"],
-            display_name=data["displayName"],
-            description="",
-            created_date=None,
-            follower_count=0,
-            following_count=0,
-            friend_count=0,
-            is_verified=data.get(
-                "hasVerifiedBadge", False
+            self._fetch_thumbnail(
+                "full_body",
+                "/v1/users/avatar",
+                user_id,
+                full_body_size,
             ),
         )
 
-    @staticmethod
-    def _extract_thumbnail_url(
-        response: dict[str, Any],
-    ) -> str:
-        data = response.get("data")
-        if not data:
-            return ""
-        return data[0].get("imageUrl", "")
-
-    @staticmethod
-    def _parse_user_badge(
-        data: dict[str, Any],
-    ) -> UserBadge:
-        created = data.get("created")
-        created_date = (
-            datetime.fromisoformat(
-                created.replace("Z", "+00:00")
-            )
-            if created
-            else None
+        return UserAvatar(
+            user_id=user_id,
+            headshot_url=headshot_url,
+            bust_url=bust_url,
+            full_body_url=full_body_url,
         )
 
-        statistics = data.get("statistics", {})
-
-        return UserBadge(
-            id=data["id"],
-            name=data["name"],
-            description=data.get(
-                "description", ""
-            ),
-            enabled=data.get("enabled", True),
-            icon_image_id=data.get(
-                "iconImageId", 0
-            ),
-            created=created_date,
-            awarded_count=statistics.get(
-                "awardedCount", 0
-            ),
-            win_rate_percentage=statistics.get(
-                "winRatePercentage", 0.0
-            ),
-        )
+    async def _fetch_thumbnail(
+        self,
+        kind: str,
+        path: str,
+        user_id: int,
+        size: str,
+    ) -> tuple[str, str]:
+        try:
+            response = await self._http.get(
+                "thumbnails",
+                f"{path}?userIds={user_id}"
+                f"&size={size}&format=Png",
+            )
+        except Exception as e:
+            log.warning(
+                "can't get %s thumbnail for user %d: %s",
+                kind,
+                user_id,
+                e,
+            )
+            return kind, ""
 
-    @staticmethod
-    def _parse_user_presence(
-        data: dict[str, Any],
-    ) -> UserPresence:
-        return UserPresence(
-            user_id=data["userId"],
-            presence_type=data.get(
-                "userPresenceType", 0
-            ),
-            last_location=data.get(
-                "lastLocation", ""
-            ),
-            place_id=data.get("placeId"),
-            root_place_id=data.get("rootPlaceId"),
-            game_id=data.get("gameId"),
-            universe_id=data.get("universeId"),
+        return kind, self._extract_thumbnail_url(
+            response
         )
 
-    @staticmethod
-    def _parse_game_basic(
-        data: dict[str, Any],
-    ) -> Game:
-        created = data.get("created")
-        created_date = (
-            datetime.fromisoformat(
-                created.replace("Z", "+00:00")
+    async def _fetch_thumbnails(
+        self,
+        kind: str,
+        path: str,
+        joined_ids: str,
+        count: int,
+        size: str,
+    ) -> dict[int, str]:
+        try:
+            response = await self._http.get(
+                "thumbnails",
+                f"{path}?userIds={joined_ids}"
+                f"&size={size}&format=Png",
             )
-            if created
-            else None
-        )
+        except Exception as e:
+            log.warning(
+                "can't get %s thumbnails for %d users: %s",
+                kind,
+                count,
+                e,
+            )
+            return {}
 
-        creator = data.get("creator", {})
+        return self._extract_thumbnail_urls(response)
 
-        return Game(
-            id=data.get("id", 0),
-            root_place_id=data.get(
-                "rootPlaceId", 0
+    async def _fetch_counts(
+        self,
+        user_id: int,
+    ) -> tuple[int, int, int]:
+        followers, following, friends = await gather(
+            _count_safe(
+                self.get_user_follower_count(user_id)
             ),
-            name=data.get("name", ""),
-            description=data.get(
-                "description", ""
+            _count_safe(
+                self.get_user_following_count(user_id)
             ),
-            creator_id=creator.get("id", 0),
-            creator_name=creator.get("name", ""),
-            creator_type=creator.get(
-                "type", "User"
+            _count_safe(
+                self.get_user_friend_count(user_id)
             ),
-            playing=data.get("playing", 0),
-            visits=data.get("visits", 0),
-            max_players=data.get("maxPlayers", 0),
-            created=created_date,
-            genre=data.get("genre", ""),
         )
+        return followers, following, friends
 
     @staticmethod
-    def _parse_game_detailed(
-        data: dict[str, Any],
-    ) -> Game:
-        created = data.get("created")
-        created_date = (
-            datetime.fromisoformat(
-                created.replace("Z", "+00:00")
-            )
-            if created
-            else None
-        )
-
-        creator = data.get("creator", {})
-
-        return Game(
-            id=data["id"],
-            root_place_id=data["rootPlaceId"],
-            name=data["name"],
-            description=data.get(
-                "description", ""
-            ),
-            creator_id=creator.get("id", 0),
-            creator_name=creator.get("name", ""),
-            creator_type=creator.get(
-                "type", "User"
-            ),
-            playing=data.get("playing", 0),
-            visits=data.get("visits", 0),
-            max_players=data.get("maxPlayers", 0),
-            created=created_date,
-            genre=data.get("genre", ""),
-        )
+    def _extract_thumbnail_url(
+        response: dict[str, Any],
+    ) -> str:
+        data = response.get("data")
+        if not data:
+            return ""
+        return data[0].get("imageUrl", "")
 
     @staticmethod
-    def _parse_limited_item(
-        data: dict[str, Any],
-    ) -> LimitedItem:
-        return LimitedItem(
-            user_asset_id=data.get(
-                "userAssetId", 0
-            ),
-            serial_number=data.get(
-                "serialNumber", 0
-            ),
-            asset_id=data.get("assetId", 0),
-            name=data.get("name", ""),
-            recent_average_price=data.get(
-                "recentAveragePrice", 0
-            ),
-            original_price=data.get(
-                "originalPrice", 0
-            ),
-            asset_stock=data.get("assetStock", 0),
-            is_on_hold=data.get(
-                "isOnHold", False
-            ),
-        )
+    def _extract_thumbnail_urls(
+        response: dict[str, Any],
+    ) -> dict[int, str]:
+        urls: dict[int, str] = {}
+        for entry in response.get("data") or ():
+            target_id = entry.get("targetId")
+            if target_id is None:
+                log.warning(
+                    "thumbnail data looks wonky: %s",
+                    entry,
+                )
+                continue
+            urls[target_id] = entry.get("imageUrl") or ""
+        return urls
@@ -2,7 +2,9 @@ from .http import HTTPClient
 from .performance import PerformanceMonitor
 from .utils import (
     APICache,
+    TokenBucket,
     get_api_endpoint,
+    parse_iso,
     rate_limit,
     retry_on_failure,
 )
@@ -11,7 +13,9 @@ __all__ = [
     "APICache",
     "HTTPClient",
     "PerformanceMonitor",
+    "TokenBucket",
     "get_api_endpoint",
+    "parse_iso",
     "rate_limit",
     "retry_on_failure",
 ]
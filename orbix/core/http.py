@@ -2,66 +2,186 @@ from __future__ import annotations
 
 import builtins
 import logging
-from asyncio import sleep
-from json import JSONDecodeError, dumps
-from typing import Any, Self
+from asyncio import (
+    AbstractEventLoop,
+    Future,
+    ensure_future,
+    get_running_loop,
+    shield,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    NoReturn,
+    Self,
+)
 
+import orjson
 from aiohttp import (
     ClientError,
     ClientResponse,
     ClientSession,
     ClientTimeout,
-    ContentTypeError,
     TCPConnector,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
 from ..exceptions import (
     NetworkError,
     RateLimitError,
     RobloxAPIError,
     UserNotFoundError,
 )
-from .utils import APICache, get_api_endpoint
+from .utils import (
+    APICache,
+    TokenBucket,
+    get_api_endpoint,
+)
 
 log = logging.getLogger(__name__)
 
+_RATE_LIMITS: dict[str, int] = {
+    "users": 120,
+    "thumbnails": 180,
+    "friends": 60,
+}
+
+_HEADERS: dict[str, str] = {
+    "User-Agent": "orbix/1.0.0 (+https://github.com/bramazine/orbix)",
+    "Accept": "application/json",
+    "Content-Type": "application/json",
+}
+
+
+def _create_connector() -> TCPConnector:
+    return TCPConnector(
+        limit=100,
+        limit_per_host=30,
+        ttl_dns_cache=300,
+        use_dns_cache=True,
+        keepalive_timeout=75,
+    )
+
+
+def _raise_not_found(
+    response: ClientResponse,
+) -> NoReturn:
+    url = str(response.url)
+    if "/users/" in url:
+        raise UserNotFoundError(url)
+    raise RobloxAPIError(
+        "resource not found", response.status
+    )
+
+
+def _raise_rate_limited(
+    response: ClientResponse,
+) -> NoReturn:
+    retry_after = response.headers.get("Retry-After")
+    raise RateLimitError(
+        int(retry_after) if retry_after else None
+    )
+
+
+_STATUS_HANDLERS: dict[
+    int, Callable[[ClientResponse], NoReturn]
+] = {
+    404: _raise_not_found,
+    429: _raise_rate_limited,
+}
+
 
 class HTTPClient:
+    _buckets: ClassVar[dict[str, TokenBucket]] = {}
+    _shared_sessions: ClassVar[
+        dict[AbstractEventLoop, ClientSession]
+    ] = {}
+
     def __init__(
         self,
         timeout: int = 30,
         cache_ttl: int = 300,
+        cache_size: int = 10_000,
+        shared: bool = False,
     ) -> None:
+        if cache_size < 1:
+            raise ValueError(
+                "cache_size must be at least 1"
+            )
+
         self._session: ClientSession | None = None
+        self._shared = shared
         self._timeout = ClientTimeout(
             total=timeout
         )
-        self._cache = APICache(ttl=cache_ttl)
-        self._headers = {
-            "User-Agent": "orbix/1.0.0 (+https://github.com/bramazine/orbix)",
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
-
-    def _create_connector(self) -> TCPConnector:
-        return TCPConnector(
-            limit=100,
-            limit_per_host=30,
-            ttl_dns_cache=300,
-            use_dns_cache=True,
-            keepalive_timeout=30,
+        self._cache = APICache(
+            ttl=cache_ttl,
+            max_size=cache_size,
         )
+        self._inflight: dict[
+            Hashable, Future[dict[str, Any]]
+        ] = {}
+
+    @classmethod
+    def _bucket(
+        cls,
+        endpoint_type: str,
+    ) -> TokenBucket:
+        bucket = cls._buckets.get(endpoint_type)
+        if bucket is None:
+            calls_per_minute = _RATE_LIMITS.get(
+                endpoint_type, 120
+            )
+            bucket = cls._buckets[endpoint_type] = (
+                TokenBucket(
+                    calls_per_minute,
+                    calls_per_minute / 60,
+                )
+            )
+        return bucket
+
+    @classmethod
+    def _get_shared_session(cls) -> ClientSession:
+        loop = get_running_loop()
+        sessions = cls._shared_sessions
+        session = sessions.get(loop)
+        if session is None or session.closed:
+            for stale in [
+                other
+                for other in sessions
+                if other.is_closed()
+            ]:
+                del sessions[stale]
+            session = sessions[loop] = ClientSession(
+                headers=_HEADERS,
+                connector=_create_connector(),
+            )
+        return session
+
+    @classmethod
+    async def close_shared(cls) -> None:
+        session = cls._shared_sessions.pop(
+            get_running_loop(), None
+        )
+        if session is not None and not session.closed:
+            await session.close()
 
     @property
     def session(self) -> ClientSession:
+        if self._shared:
+            return self._get_shared_session()
+
         if (
             self._session is None
             or self._session.closed
         ):
             self._session = ClientSession(
                 timeout=self._timeout,
-                headers=self._headers,
-                connector=self._create_connector(),
+                headers=_HEADERS,
+                connector=_create_connector(),
             )
         return self._session
 
@@ -71,7 +191,6 @@ class HTTPClient:
             and not self._session.closed
         ):
             await self._session.close()
-            await sleep(0.1)
 
     async def __aenter__(self) -> Self:
         return self
@@ -90,27 +209,86 @@ class HTTPClient:
         endpoint_type: str,
         path: str,
         params: dict[str, Any] | None = None,
-        data: dict[str, Any] | None = None,
+        data: dict[str, Any] | list[Any] | None = None,
         use_cache: bool = True,
+        cache_key: Hashable | None = None,
+        body: bytes | None = None,
     ) -> dict[str, Any]:
         base_url = get_api_endpoint(endpoint_type)
         url = f"{base_url}{path}"
 
-        cache_key = (
-            f"{method}:{url}:"
-            f"{dumps(params, sort_keys=True) if params else ''}"
-        )
-        if method == "GET" and use_cache:
+        if cache_key is None:
+            cacheable = use_cache and method == "GET"
+            cache_key = (
+                method,
+                url,
+                tuple(sorted(params.items()))
+                if params
+                else (),
+            )
+            flight_key: Hashable | None = None
+        else:
+            cacheable = use_cache
+            cache_key = flight_key = (
+                method,
+                url,
+                cache_key,
+            )
+
+        if cacheable:
             cached = self._cache.get(cache_key)
             if cached is not None:
                 return cached
 
+        if body is None and data is not None:
+            body = orjson.dumps(data)
+
+        if flight_key is None:
+            flight_key = (cache_key, body)
+
+        flight = self._inflight.get(flight_key)
+        if flight is None:
+            flight = ensure_future(
+                self._send(
+                    method,
+                    endpoint_type,
+                    url,
+                    params,
+                    body,
+                    cache_key if cacheable else None,
+                )
+            )
+            self._inflight[flight_key] = flight
+
+            def finish(
+                done: Future[dict[str, Any]],
+            ) -> None:
+                self._inflight.pop(flight_key, None)
+                if not done.cancelled():
+                    done.exception()
+
+            flight.add_done_callback(finish)
+
+        return await shield(flight)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint_type: str,
+        url: str,
+        params: dict[str, Any] | None,
+        body: bytes | None,
+        cache_key: Hashable | None,
+    ) -> dict[str, Any]:
+        await self._bucket(endpoint_type).acquire()
+
         try:
             async with self.session.request(
                 method=method,
                 url=url,
                 params=params,
-                json=data,
+                data=body,
+                timeout=self._timeout,
             ) as response:
                 await (
                     self._handle_response_errors(
@@ -118,11 +296,14 @@ class HTTPClient:
                     )
                 )
 
-                response_data = (
-                    await response.json()
-                )
+                try:
+                    response_data = orjson.loads(
+                        await response.read()
+                    )
+                except orjson.JSONDecodeError as e:
+                    raise NetworkError(e) from e
 
-                if method == "GET" and use_cache:
+                if cache_key is not None:
                     self._cache.set(
                         cache_key,
                         response_data,
@@ -139,45 +320,29 @@ class HTTPClient:
         self,
         response: ClientResponse,
     ) -> None:
-        if response.status == 200:
+        status = response.status
+        if status == 200:
             return
 
-        if response.status == 404:
-            if "/users/" in str(response.url):
-                raise UserNotFoundError(
-                    str(response.url)
-                )
-            raise RobloxAPIError(
-                "resource not found",
-                response.status,
-            )
-
-        if response.status == 429:
-            retry_after = response.headers.get(
-                "Retry-After"
-            )
-            raise RateLimitError(
-                int(retry_after)
-                if retry_after
-                else None
-            )
+        handler = _STATUS_HANDLERS.get(status)
+        if handler is not None:
+            handler(response)
 
+        error_message = f"HTTP {status}"
         try:
-            error_data = await response.json()
-            error_message = error_data.get(
-                "message",
-                f"HTTP {response.status}",
-            )
-        except (
-            JSONDecodeError,
-            ContentTypeError,
-        ):
-            error_message = (
-                f"HTTP {response.status}"
+            error_data = orjson.loads(
+                await response.read()
             )
+        except orjson.JSONDecodeError:
+            pass
+        else:
+            if isinstance(error_data, dict):
+                error_message = error_data.get(
+                    "message", error_message
+                )
 
         raise RobloxAPIError(
-            error_message, response.status
+            error_message, status
         )
 
     async def get(
@@ -199,8 +364,9 @@ class HTTPClient:
         self,
         endpoint_type: str,
         path: str,
-        data: dict[str, Any] | None = None,
+        data: dict[str, Any] | list[Any] | None = None,
         params: dict[str, Any] | None = None,
+        cache_key: Hashable | None = None,
     ) -> dict[str, Any]:
         return await self.request(
             "POST",
@@ -208,5 +374,24 @@ class HTTPClient:
             path,
             params=params,
             data=data,
-            use_cache=False,
+            use_cache=cache_key is not None,
+            cache_key=cache_key,
+        )
+
+    async def post_raw(
+        self,
+        endpoint_type: str,
+        path: str,
+        body: bytes,
+        params: dict[str, Any] | None = None,
+        cache_key: Hashable | None = None,
+    ) -> dict[str, Any]:
+        return await self.request(
+            "POST",
+            endpoint_type,
+            path,
+            params=params,
+            use_cache=cache_key is not None,
+            cache_key=cache_key,
+            body=body,
         )
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-import time
-from collections import defaultdict
+from collections import deque
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from itertools import islice
+from math import inf
+from time import perf_counter_ns
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from collections.abc import (
         AsyncGenerator,
+        Iterable,
     )
 
 
@@ -16,18 +19,30 @@ if TYPE_CHECKING:
 class RequestMetrics:
     endpoint: str
     method: str
-    duration: float
+    duration_ns: int
     success: bool
     cached: bool
 
 
+@dataclass(slots=True)
+class _EndpointTotals:
+    total: int = 0
+    successful: int = 0
+    cached: int = 0
+    duration_sum: int = 0
+
+
 class PerformanceMonitor:
     def __init__(
         self,
         max_metrics: int = 1000,
     ) -> None:
-        self._metrics: list[RequestMetrics] = []
-        self._max_metrics = max_metrics
+        self._metrics: deque[RequestMetrics] = (
+            deque(maxlen=max_metrics)
+        )
+        self._endpoint_totals: dict[
+            str, _EndpointTotals
+        ] = {}
 
     @asynccontextmanager
     async def track_request(
@@ -36,7 +51,7 @@ class PerformanceMonitor:
         method: str,
         cached: bool = False,
     ) -> AsyncGenerator[None]:
-        start_time = time.time()
+        start = perf_counter_ns()
         success = True
 
         try:
@@ -45,12 +60,12 @@ class PerformanceMonitor:
             success = False
             raise
         finally:
-            duration = time.time() - start_time
+            duration_ns = perf_counter_ns() - start
             self._add_metric(
                 RequestMetrics(
                     endpoint=endpoint,
                     method=method,
-                    duration=duration,
+                    duration_ns=duration_ns,
                     success=success,
                     cached=cached,
                 )
@@ -61,14 +76,28 @@ class PerformanceMonitor:
         metric: RequestMetrics,
     ) -> None:
         self._metrics.append(metric)
-        if len(self._metrics) > self._max_metrics:
-            self._metrics.pop(0)
 
-    def _calculate_basic_stats(
-        self,
-        metrics: list[RequestMetrics],
+        totals = self._endpoint_totals.get(
+            metric.endpoint
+        )
+        if totals is None:
+            totals = self._endpoint_totals[
+                metric.endpoint
+            ] = _EndpointTotals()
+
+        totals.total += 1
+        totals.successful += metric.success
+        totals.cached += metric.cached
+        totals.duration_sum += metric.duration_ns
+
+    @staticmethod
+    def _format_stats(
+        total: int,
+        successful: int,
+        cached: int,
+        duration_sum: int,
     ) -> dict[str, Any]:
-        if not metrics:
+        if not total:
             return {
                 "total_requests": 0,
                 "avg_duration": 0,
@@ -76,22 +105,10 @@ class PerformanceMonitor:
                 "cache_hit_rate": 0,
             }
 
-        total = len(metrics)
-        successful = sum(
-            1 for m in metrics if m.success
-        )
-        cached = sum(
-            1 for m in metrics if m.cached
-        )
-        avg_duration = (
-            sum(m.duration for m in metrics)
-            / total
-        )
-
         return {
             "total_requests": total,
             "avg_duration": round(
-                avg_duration, 3
+                duration_sum / total / 1e9, 3
             ),
             "success_rate": round(
                 (successful / total) * 100, 2
@@ -101,47 +118,69 @@ class PerformanceMonitor:
             ),
         }
 
-    def get_stats(
+    def _calculate_basic_stats(
         self,
-        last_n: int = 100,
+        metrics: Iterable[RequestMetrics],
+        include_extremes: bool = False,
     ) -> dict[str, Any]:
-        recent = (
-            self._metrics[-last_n:]
-            if self._metrics
-            else []
-        )
-        stats = self._calculate_basic_stats(
-            recent
+        total = 0
+        successful = 0
+        cached = 0
+        duration_sum = 0
+        fastest = inf
+        slowest = 0
+
+        for m in metrics:
+            total += 1
+            successful += m.success
+            cached += m.cached
+            duration = m.duration_ns
+            duration_sum += duration
+            if duration < fastest:
+                fastest = duration
+            if duration > slowest:
+                slowest = duration
+
+        stats = self._format_stats(
+            total,
+            successful,
+            cached,
+            duration_sum,
         )
 
-        if recent:
-            stats["fastest_request"] = min(
-                m.duration for m in recent
-            )
-            stats["slowest_request"] = max(
-                m.duration for m in recent
-            )
+        if total and include_extremes:
+            stats["fastest_request"] = fastest / 1e9
+            stats["slowest_request"] = slowest / 1e9
 
         return stats
 
+    def get_stats(
+        self,
+        last_n: int = 100,
+    ) -> dict[str, Any]:
+        return self._calculate_basic_stats(
+            islice(
+                self._metrics,
+                max(0, len(self._metrics) - last_n),
+                None,
+            ),
+            include_extremes=True,
+        )
+
     def get_endpoint_stats(
         self,
     ) -> dict[str, dict[str, Any]]:
-        endpoint_metrics: defaultdict[
-            str, list[RequestMetrics]
-        ] = defaultdict(list)
-
-        for metric in self._metrics:
-            endpoint_metrics[
-                metric.endpoint
-            ].append(metric)
-
+        format_stats = self._format_stats
         return {
-            endpoint: self._calculate_basic_stats(
-                metrics
+            endpoint: format_stats(
+                totals.total,
+                totals.successful,
+                totals.cached,
+                totals.duration_sum,
             )
-            for endpoint, metrics in endpoint_metrics.items()
+            for endpoint, totals in self._endpoint_totals.items()
         }
 
     def clear_metrics(self) -> None:
         self._metrics.clear()
+        self._endpoint_totals.clear()
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import time
 from asyncio import sleep
-from collections import OrderedDict, deque
+from collections import OrderedDict
+from datetime import datetime, timezone
 from functools import lru_cache, wraps
 from typing import TYPE_CHECKING, Any, TypeVar
 
@@ -10,10 +11,9 @@ if TYPE_CHECKING:
     from collections.abc import (
         Awaitable,
         Callable,
+        Hashable,
     )
 
-from ..exceptions import RateLimitError
-
 T = TypeVar("T")
 
 
@@ -26,33 +26,17 @@ def rate_limit(
     def decorator(
         func: Callable[..., Awaitable[T]],
     ) -> Callable[..., Awaitable[T]]:
-        call_times: deque[float] = deque()
+        bucket = TokenBucket(
+            calls_per_minute,
+            calls_per_minute / 60,
+        )
 
         @wraps(func)
         async def wrapper(
             *args: Any,  # noqa: ANN401
             **kwargs: Any,  # noqa: ANN401
         ) -> T:
-            now = time.time()
-
-            while (
-                call_times
-                and now - call_times[0] >= 60
-            ):
-                call_times.popleft()
-
-            if (
-                len(call_times)
-                >= calls_per_minute
-            ):
-                sleep_time = 60 - (
-                    now - call_times[0]
-                )
-                raise RateLimitError(
-                    int(sleep_time)
-                )
-
-            call_times.append(now)
+            await bucket.acquire()
             return await func(*args, **kwargs)
 
         return wrapper
@@ -100,6 +84,39 @@ def retry_on_failure(
     return decorator
 
 
+class TokenBucket:
+    def __init__(
+        self,
+        capacity: float,
+        refill_rate: float,
+    ) -> None:
+        self._capacity = capacity
+        self._refill_rate = refill_rate
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+
+    async def acquire(
+        self,
+        cost: float = 1,
+    ) -> None:
+        now = time.monotonic()
+        self._tokens = (
+            min(
+                self._capacity,
+                self._tokens
+                + (now - self._last_refill)
+                * self._refill_rate,
+            )
+            - cost
+        )
+        self._last_refill = now
+
+        if self._tokens < 0:
+            await sleep(
+                -self._tokens / self._refill_rate
+            )
+
+
 _API_ENDPOINTS: dict[str, str] = {
     "users": "https://users.roblox.com",
     "thumbnails": "https://thumbnails.roblox.com",
@@ -120,48 +137,116 @@ def get_api_endpoint(
     )
 
 
+@lru_cache(maxsize=1024)
+def parse_iso(
+    value: str | None,
+) -> datetime | None:
+    if not value:
+        return None
+
+    if (
+        len(value) >= 20
+        and value[-1] == "Z"
+        and value[19] in ".Z"
+    ):
+        fraction = value[20:-1]
+        try:
+            return datetime(
+                int(value[0:4]),
+                int(value[5:7]),
+                int(value[8:10]),
+                int(value[11:13]),
+                int(value[14:16]),
+                int(value[17:19]),
+                int(fraction.ljust(6, "0")[:6])
+                if fraction
+                else 0,
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            pass
+
+    return datetime.fromisoformat(value)
+
+
 class APICache:
+    _SWEEP_EVERY = 128
+
     def __init__(
         self,
         ttl: int = 300,
         max_size: int = 1000,
     ) -> None:
         self._cache: OrderedDict[
-            str, tuple[float, Any]
+            Hashable, tuple[float, Any]
         ] = OrderedDict()
+        self._buckets: dict[
+            int, set[Hashable]
+        ] = {}
         self._ttl = ttl
         self._max_size = max_size
+        self._sets_since_sweep = 0
 
-    def get(self, key: str) -> Any | None:  # noqa: ANN401
-        if key not in self._cache:
+    def get(self, key: Hashable) -> Any | None:  # noqa: ANN401
+        entry = self._cache.get(key)
+        if entry is None:
             return None
 
-        timestamp, value = self._cache[key]
-        if time.time() - timestamp > self._ttl:
+        expires_at, value = entry
+        if time.monotonic() > expires_at:
             del self._cache[key]
             return None
 
-        self._cache.move_to_end(key)
         return value
 
     def set(
         self,
-        key: str,
+        key: Hashable,
         value: Any,  # noqa: ANN401
     ) -> None:
-        if key in self._cache:
-            del self._cache[key]
-
-        while len(self._cache) >= self._max_size:
-            self._cache.popitem(last=False)
-
-        self._cache[key] = (
-            time.time(),
-            value,
-        )
+        cache = self._cache
+        if key in cache:
+            del cache[key]
+
+        while len(cache) >= self._max_size:
+            cache.popitem(last=False)
+
+        expires_at = time.monotonic() + self._ttl
+        cache[key] = (expires_at, value)
+
+        second = int(expires_at)
+        bucket = self._buckets.get(second)
+        if bucket is None:
+            bucket = self._buckets[second] = set()
+        bucket.add(key)
+
+        self._sets_since_sweep += 1
+        if self._sets_since_sweep >= self._SWEEP_EVERY:
+            self._sweep()
+
+    def _sweep(self) -> None:
+        self._sets_since_sweep = 0
+        now = time.monotonic()
+        cache = self._cache
+        buckets = self._buckets
+
+        while buckets:
+            second = next(iter(buckets))
+            if second + 1 > now:
+                break
+
+            for key in buckets.pop(second):
+                entry = cache.get(key)
+                if (
+                    entry is not None
+                    and entry[0] < now
+                ):
+                    del cache[key]
 
     def clear(self) -> None:
         self._cache.clear()
+        self._buckets.clear()
+        self._sets_since_sweep = 0
 
     def get_stats(self) -> dict[str, int]:
         return {
@@ -3,7 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from .core.utils import parse_iso
+
 if TYPE_CHECKING:
+    from array import array
+    from collections.abc import Iterator
     from datetime import datetime
 
 
@@ -13,17 +17,55 @@ class UserProfile:
     username: str
     display_name: str
     description: str
-    created_date: datetime | None
+    created_raw: str | None
     follower_count: int
     following_count: int
     friend_count: int
     is_verified: bool
 
+    @property
+    def created_date(self) -> datetime | None:
+        return parse_iso(self.created_raw)
+
     @property
     def profile_url(self) -> str:
         return f"https://www.roblox.com/users/{self.id}/profile"
 
 
+@dataclass(frozen=True, slots=True)
+class UserProfileBatch:
+    ids: array[int]
+    usernames: list[str]
+    display_names: list[str]
+    descriptions: list[str]
+    created_raws: list[str | None]
+    verified: list[bool]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(
+        self,
+        index: int,
+    ) -> UserProfile:
+        return UserProfile(
+            id=self.ids[index],
+            username=self.usernames[index],
+            display_name=self.display_names[index],
+            description=self.descriptions[index],
+            created_raw=self.created_raws[index],
+            follower_count=0,
+            following_count=0,
+            friend_count=0,
+            is_verified=self.verified[index],
+        )
+
+    def __iter__(self) -> Iterator[UserProfile]:
+        return map(
+            self.__getitem__, range(len(self))
+        )
+
+
 @dataclass(frozen=True, slots=True)
 class UserAvatar:
     user_id: int
@@ -44,6 +86,13 @@ class UserBadge:
     win_rate_percentage: float
 
 
+@dataclass(frozen=True, slots=True)
+class BadgePage:
+    badges: list[UserBadge]
+    previous_cursor: str | None
+    next_cursor: str | None
+
+
 @dataclass(frozen=True, slots=True)
 class UserPresence:
     user_id: int
@@ -76,6 +125,13 @@ class FavouriteGame:
     game: Game
 
 
+@dataclass(frozen=True, slots=True)
+class FavouriteGamePage:
+    favourite_games: list[FavouriteGame]
+    previous_cursor: str | None
+    next_cursor: str | None
+
+
 @dataclass(frozen=True, slots=True)
 class WearingItem:
     asset_id: int
@@ -91,3 +147,10 @@ class LimitedItem:
     original_price: int
     asset_stock: int
     is_on_hold: bool
+
+
+@dataclass(frozen=True, slots=True)
+class LimitedItemPage:
+    limited_items: list[LimitedItem]
+    previous_cursor: str | None
+    next_cursor: str | None